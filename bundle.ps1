@@ -1,30 +1,62 @@
+param(
+    [switch]$Jlink
+)
+
 if (-not (Get-Command pyinstaller -ErrorAction SilentlyContinue)) {
     Write-Host "pyinstaller is not found. Please source the virtual environment."
     exit 1
 }
 
-if (-not (Test-Path -Path "jre" -PathType Container)) {
-    Write-Host "Running PyInstaller without JRE..."
-    pyinstaller -F irgen/src/irgen/main.py `
-        --name irgen `
-        --paths irgen/src `
-        --add-data "schema/target/ipxact-schema-1.0.0.jar;jar/" `
-        --add-data "schema/target/dependency/*;jar/dependency" `
-        --exclude-module pytest `
-        --exclude-module ruff `
-        --exclude-module mypy `
-        --console `
+# bundle.ps1 -Jlink: create a trimmed JRE with a CDS archive of its JDK classes
+if ($Jlink) {
+    if (-not (Test-Path Env:\JAVA_HOME)) {
+        Write-Host "JAVA_HOME is not set. Please set JAVA_HOME to your JDK installation."
+        exit 1
+    }
+
+    $classPath = (Get-ChildItem "schema/target/dependency/*.jar" | ForEach-Object { $_.FullName }) -join ";"
+    $modules = & "$env:JAVA_HOME\bin\jdeps" --print-module-deps --ignore-missing-deps `
+        --multi-release 21 --class-path $classPath `
+        schema/target/ipxact-schema-1.0.0.jar
+    if ($LASTEXITCODE -ne 0) {
+        Write-Host "jdeps failed. Please check the errors above."
+        exit 1
+    }
+
+    Write-Host "Creating JRE with modules: $modules"
+    if (Test-Path -Path "jre") {
+        Remove-Item -Recurse -Force "jre"
+    }
+    # --generate-cds-archive adds a CDS archive of the JDK classes to the JRE
+    & "$env:JAVA_HOME\bin\jlink" `
+        --add-modules "$modules,jdk.unsupported" `
+        --strip-debug `
+        --no-man-pages `
+        --no-header-files `
+        --generate-cds-archive `
+        --output jre
+    if ($LASTEXITCODE -ne 0) {
+        Write-Host "jlink failed. Please check the errors above."
+        exit 1
+    }
+}
+
+$extraData = @()
+if (Test-Path -Path "jre" -PathType Container) {
+    Write-Host "Bundling JRE..."
+    $extraData += @("--add-data", "jre/;jre/")
 }
-else {
-    Write-Host "Running PyInstaller with JRE..."
-    pyinstaller -F irgen/src/irgen/main.py `
-        --name irgen `
-        --paths irgen/src `
-        --add-data "jre/;jre/" `
-        --add-data "schema/target/ipxact-schema-1.0.0.jar;jar/" `
-        --add-data "schema/target/dependency/*;jar/dependency" `
-        --exclude-module pytest `
-        --exclude-module ruff `
-        --exclude-module mypy `
-        --console `
-}
\ No newline at end of file
+# irgen.jsa (irgen warmup) is not bundled: the one-file executable extracts the
+# class path to a new directory on every run, which no application archive matches
+
+Write-Host "Running PyInstaller..."
+pyinstaller -F irgen/src/irgen/main.py `
+    --name irgen `
+    --paths irgen/src `
+    @extraData `
+    --add-data "schema/target/ipxact-schema-1.0.0.jar;jar/" `
+    --add-data "schema/target/dependency/*;jar/dependency" `
+    --exclude-module pytest `
+    --exclude-module ruff `
+    --exclude-module mypy `
+    --console
@@ -5,28 +5,54 @@ if ! command -v pyinstaller &> /dev/null; then
     exit 1
 fi
 
-if [ ! -d "jre"]; then
-    echo "Running PyInstaller without JRE..."
-    pyinstaller -F irgen/src/irgen/main.py \
-        --name irgen \
-        --paths irgen/src \
-        --add-data "schema/target/ipxact-schema-1.0.0.jar:jar/" \
-        --add-data "schema/target/dependency/*:jar/dependency" \
-        --exclude-module pytest \
-        --exclude-module ruff \
-        --exclude-module mypy \
-        --console
-else
-    echo "Running PyInstaller with JRE..."
-    pyinstaller -F irgen/src/irgen/main.py \
-        --name irgen \
-        --paths irgen/src \
-        --add-data "jre/:jre/" \
-        --add-data "schema/target/ipxact-schema-1.0.0.jar:jar/" \
-        --add-data "schema/target/dependency/*:jar/dependency" \
-        --exclude-module pytest \
-        --exclude-module ruff \
-        --exclude-module mypy \
-        --console
+# bundle.sh --jlink: create a trimmed JRE with a CDS archive of its JDK classes
+if [ "$1" == "--jlink" ]; then
+    if [ -z "$JAVA_HOME" ]; then
+        echo "JAVA_HOME is not set. Please set JAVA_HOME to your JDK installation."
+        exit 1
+    fi
+
+    class_path=$(ls schema/target/dependency/*.jar | tr '\n' ':')
+    modules=$("$JAVA_HOME/bin/jdeps" --print-module-deps --ignore-missing-deps \
+        --multi-release 21 --class-path "$class_path" \
+        schema/target/ipxact-schema-1.0.0.jar)
+    if [ $? -ne 0 ]; then
+        echo "jdeps failed. Please check the errors above."
+        exit 1
+    fi
+
+    echo "Creating JRE with modules: $modules"
+    rm -rf jre
+    # --generate-cds-archive adds a CDS archive of the JDK classes to the JRE
+    "$JAVA_HOME/bin/jlink" \
+        --add-modules "$modules,jdk.unsupported" \
+        --strip-debug \
+        --no-man-pages \
+        --no-header-files \
+        --generate-cds-archive \
+        --output jre
+    if [ $? -ne 0 ]; then
+        echo "jlink failed. Please check the errors above."
+        exit 1
+    fi
+fi
+
+extra_data=()
+if [ -d "jre" ]; then
+    echo "Bundling JRE..."
+    extra_data+=(--add-data "jre/:jre/")
 fi
+# irgen.jsa (irgen warmup) is not bundled: the one-file executable extracts the
+# class path to a new directory on every run, which no application archive matches
 
+echo "Running PyInstaller..."
+pyinstaller -F irgen/src/irgen/main.py \
+    --name irgen \
+    --paths irgen/src \
+    "${extra_data[@]}" \
+    --add-data "schema/target/ipxact-schema-1.0.0.jar:jar/" \
+    --add-data "schema/target/dependency/*:jar/dependency" \
+    --exclude-module pytest \
+    --exclude-module ruff \
+    --exclude-module mypy \
+    --console
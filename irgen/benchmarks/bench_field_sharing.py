@@ -0,0 +1,77 @@
+"""Heap usage and build time of `process_register_sheet` for large register arrays.
+
+Usage: python benchmarks/bench_field_sharing.py [instances] [--ipxact-version VER]
+"""
+
+import time
+import argparse
+
+import polars as pl
+import jpype
+
+from irgen.jpath import get_class_path, get_jvm_path
+from irgen.parser import process_register_sheet
+from irgen.config import *
+
+
+def make_array_sheet(instances: int) -> pl.DataFrame:
+    """A register sheet with one `rega{n}` array of four fields per instance."""
+    return pl.DataFrame(
+        {
+            "ADDR": ["0x0", None, None, None],
+            "REG": [f"rega{{n}}, n=0~{instances - 1}", None, None, None],
+            "FIELD": ["field3", "field2", "field1", "field0"],
+            "BIT": ["[31:24]", "[23:16]", "[15:8]", "[7:0]"],
+            "WIDTH": [8, 8, 8, 8],
+            "ATTRIBUTE": ["RW", "W1C", "RC", "RO"],
+            "DEFAULT": ["0x0", "0x1", "0x0", "0xff"],
+            "DESCRIPTION": [None, None, None, None],
+        }
+    )
+
+
+def used_heap() -> int:
+    System = jpype.JClass("java.lang.System")
+    Runtime = jpype.JClass("java.lang.Runtime")
+    for _ in range(3):
+        System.gc()
+    runtime = Runtime.getRuntime()
+    return runtime.totalMemory() - runtime.freeMemory()
+
+
+def run(
+    df: pl.DataFrame, object_factory, ipxact_version: str, share_fields: bool
+) -> None:
+    baseline = used_heap()
+    start = time.perf_counter()
+    registers = process_register_sheet(
+        df, object_factory, ipxact_version, share_fields=share_fields
+    )
+    elapsed = time.perf_counter() - start
+    heap = used_heap() - baseline
+    print(
+        f"share_fields={share_fields!s:<5} registers={len(registers):<8} "
+        f"time={elapsed:8.3f}s heap={heap / 2**20:8.1f}MiB"
+    )
+    del registers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("instances", nargs="?", type=int, default=100_000)
+    parser.add_argument("--ipxact-version", default=DEFAULT_IPXACT_VERSION)
+    args = parser.parse_args()
+
+    jpype.startJVM(jvmpath=get_jvm_path(), classpath=get_class_path())
+    version = args.ipxact_version.replace("1685-", "v")
+    object_factory = jpype.JClass(f"org.ieee.ipxact.{version}.ObjectFactory")()
+
+    df = make_array_sheet(args.instances)
+    for share_fields in (False, True):
+        run(df, object_factory, args.ipxact_version, share_fields)
+
+    jpype.shutdownJVM()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Cold-start time of a conversion with and without the CDS archive.
+
+Create the archive with `irgen warmup` first.
+
+Usage: python benchmarks/bench_jvm_startup.py [runs] [--ipxact-version VER]
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+
+from irgen.jpath import get_cds_archive_path
+from irgen.config import *
+
+# Each run is a fresh process, as a JVM cannot be restarted within one
+RUN = """
+import sys
+import time
+
+start = time.perf_counter()
+from irgen.api import generate_xml
+from irgen.jpath import start_jvm
+from irgen.warmup import warmup_sheets
+
+start_jvm(use_cds_archive=sys.argv[1] == "cds")
+generate_xml(warmup_sheets(), version=sys.argv[2])
+print(time.perf_counter() - start)
+"""
+
+
+def run(mode: str, ipxact_version: str, runs: int) -> list[float]:
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", RUN, mode, ipxact_version],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("runs", nargs="?", type=int, default=5)
+    parser.add_argument("--ipxact-version", default=DEFAULT_IPXACT_VERSION)
+    args = parser.parse_args()
+
+    if not get_cds_archive_path().exists():
+        parser.error(f"{get_cds_archive_path()} not found, run `irgen warmup` first.")
+
+    for mode in ("no-cds", "cds"):
+        times = run(mode, args.ipxact_version, args.runs)
+        print(
+            f"{mode:<6} median={statistics.median(times):6.3f}s "
+            f"min={min(times):6.3f}s max={max(times):6.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from irgen.api import convert, convert_async
+
+__all__ = ["convert", "convert_async"]
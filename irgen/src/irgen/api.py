@@ -0,0 +1,131 @@
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
+
+import polars as pl
+import jpype
+
+from irgen.builder import SUPPORTED_IPXACT_VERSIONS, build_component, parse_sheets
+from irgen.jpath import start_jvm
+from irgen.reader import is_table_dir, read_sheets
+from irgen.config import *
+
+ConvertSource = str | os.PathLike | bytes | IO[bytes]
+
+# All JVM work of `convert_async` runs on this single thread. JPype attaches it to
+# the JVM on its first Java call and it stays attached for the life of the process.
+_jvm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="irgen-jvm")
+
+
+def _check_version(version: str):
+    if version not in SUPPORTED_IPXACT_VERSIONS:
+        raise ValueError(f"Unsupported IP-XACT version: {version}")
+
+
+def read_workbook(
+    source: ConvertSource, *, fmt: str | None = None
+) -> dict[str, pl.DataFrame]:
+    """Read the sheets of a register map, raising if a sheet cannot be read.
+
+    `fmt` is "xlsx" (an Excel path, bytes or binary file object) or "tables" (a
+    directory of Parquet, Arrow IPC or CSV tables). By default it is "tables" for
+    directories and "xlsx" otherwise.
+    """
+    if isinstance(source, os.PathLike):
+        source = os.fspath(source)
+    elif not isinstance(source, (str, bytes)):
+        source = source.read()
+
+    fmt = fmt or ("tables" if is_table_dir(source) else "xlsx")
+    match fmt:
+        case "xlsx":
+            if is_table_dir(source):
+                raise ValueError(f"Expected an Excel file, got a directory: {source}")
+        case "tables":
+            if not is_table_dir(source):
+                raise ValueError("The 'tables' format requires a directory path.")
+        case _:
+            raise ValueError(f"Unsupported input format: {fmt}")
+    return read_sheets(source, strict=True)
+
+
+def generate_xml(
+    sheets: dict[str, pl.DataFrame],
+    *,
+    version: str = DEFAULT_IPXACT_VERSION,
+    vendor_sheet: str = DEFAULT_VENDOR_SHEET,
+    address_sheet: str = DEFAULT_ADDRESS_SHEET,
+) -> bytes:
+    """Build and marshal the IP-XACT component of already read sheets."""
+    _check_version(version)
+    start_jvm()
+    XmlGenerator = jpype.JClass("org.example.XmlGenerator")
+    IpXactVersion = jpype.JClass("org.example.IpXactVersion")
+
+    component = build_component(
+        parse_sheets(sheets, vendor_sheet, address_sheet, strict=True),
+        version,
+        strict=True,
+    )
+    return bytes(
+        XmlGenerator.generateXmlBytes(component, IpXactVersion.fromValue(version))
+    )
+
+
+def convert(
+    source: ConvertSource,
+    *,
+    version: str = DEFAULT_IPXACT_VERSION,
+    fmt: str | None = None,
+    vendor_sheet: str = DEFAULT_VENDOR_SHEET,
+    address_sheet: str = DEFAULT_ADDRESS_SHEET,
+) -> bytes:
+    """Convert a register map into IP-XACT XML bytes.
+
+    The JVM is started on first use and kept running, so repeated calls only pay
+    for the conversion itself. Unlike the command line, which logs and skips them,
+    unreadable sheets, register sheets that fail to parse, invalid vendor
+    information, address map rows and fields, and rows without a register name
+    all raise.
+    """
+    _check_version(version)
+    sheets = read_workbook(source, fmt=fmt)
+    return generate_xml(
+        sheets,
+        version=version,
+        vendor_sheet=vendor_sheet,
+        address_sheet=address_sheet,
+    )
+
+
+async def convert_async(
+    source: ConvertSource,
+    *,
+    version: str = DEFAULT_IPXACT_VERSION,
+    fmt: str | None = None,
+    vendor_sheet: str = DEFAULT_VENDOR_SHEET,
+    address_sheet: str = DEFAULT_ADDRESS_SHEET,
+) -> bytes:
+    """Asynchronous `convert`.
+
+    Reading the sheets runs on the event loop's default executor, while building
+    and marshalling run on the dedicated JVM thread, so concurrent requests are
+    pipelined over one long-lived JVM.
+    """
+    _check_version(version)
+    loop = asyncio.get_running_loop()
+    sheets = await loop.run_in_executor(
+        None, functools.partial(read_workbook, source, fmt=fmt)
+    )
+    return await loop.run_in_executor(
+        _jvm_executor,
+        functools.partial(
+            generate_xml,
+            sheets,
+            version=version,
+            vendor_sheet=vendor_sheet,
+            address_sheet=address_sheet,
+        ),
+    )
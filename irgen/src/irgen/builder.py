@@ -0,0 +1,171 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import polars as pl
+import jpype
+
+from irgen.parser import (
+    process_vendor_sheet,
+    process_address_map_sheet,
+    preprocess_register_sheet,
+    build_registers,
+)
+from irgen.config import *
+
+SUPPORTED_IPXACT_VERSIONS = ["1685-2009", "1685-2014", "1685-2022"]
+
+
+@dataclass
+class ParsedSheets:
+    """The sheets of a register map, with the register sheets pre-processed.
+
+    This is independent of the IP-XACT version, so one ParsedSheets can be used
+    to build the component of every version.
+    """
+
+    vendor: pl.DataFrame | None = None
+    address_map: pl.DataFrame | None = None
+    registers: dict[str, pl.DataFrame | None] = field(default_factory=dict)
+
+
+def get_object_factory(ipxact_version: str) -> Any:
+    """Create the JAXB ObjectFactory of an IP-XACT version."""
+    match ipxact_version:
+        case "1685-2009":
+            ObjectFactory = jpype.JClass("org.ieee.ipxact.v2009.ObjectFactory")
+        case "1685-2014":
+            ObjectFactory = jpype.JClass("org.ieee.ipxact.v2014.ObjectFactory")
+        case "1685-2022":
+            ObjectFactory = jpype.JClass("org.ieee.ipxact.v2022.ObjectFactory")
+        case _:
+            raise ValueError(f"Unsupported IP-XACT version: {ipxact_version}")
+    return ObjectFactory()
+
+
+def parse_sheets(
+    sheets: dict[str, pl.DataFrame],
+    vendor_sheet: str = DEFAULT_VENDOR_SHEET,
+    address_sheet: str = DEFAULT_ADDRESS_SHEET,
+    strict: bool = False,
+) -> ParsedSheets:
+    """Sort the sheets of a register map and pre-process its register sheets.
+
+    A register sheet that fails pre-processing is logged and left empty, or with
+    `strict`, its error is raised.
+    """
+    parsed = ParsedSheets()
+    for sheet_name, df in sheets.items():
+        if sheet_name == vendor_sheet:
+            parsed.vendor = df
+        elif sheet_name == address_sheet:
+            parsed.address_map = df
+        else:
+            try:
+                parsed.registers[sheet_name] = preprocess_register_sheet(df)
+            except pl.exceptions.PolarsError as e:
+                if strict:
+                    raise
+                logging.error(
+                    f"Polars error during pre-processing of sheet '{sheet_name}': {e}"
+                )
+                parsed.registers[sheet_name] = None
+    return parsed
+
+
+def build_component(
+    parsed: ParsedSheets,
+    ipxact_version: str,
+    with_registers: bool = True,
+    strict: bool = False,
+) -> Any:
+    """Build the IP-XACT Component object of a parsed register map.
+
+    Without `with_registers` the address blocks are left empty. Vendor, address
+    map and field errors are logged and the offending parts left out, or with
+    `strict`, they are raised.
+    """
+    object_factory = get_object_factory(ipxact_version)
+    component = None
+    address_blocks: list[Any] = []
+    all_registers: dict[str, list[Any]] = {}
+
+    if parsed.vendor is not None:
+        component = process_vendor_sheet(parsed.vendor, object_factory, strict)
+    if parsed.address_map is not None:
+        address_blocks = process_address_map_sheet(
+            parsed.address_map, object_factory, ipxact_version, strict
+        )
+    for sheet_name, parsed_df in parsed.registers.items():
+        if not with_registers:
+            continue
+        all_registers[sheet_name] = (
+            build_registers(parsed_df, object_factory, ipxact_version, strict=strict)
+            if parsed_df is not None
+            else []
+        )
+
+    if not component:
+        raise ValueError("Failed to parse vendor information.")
+    if not address_blocks:
+        raise ValueError("Failed to parse address blocks.")
+
+    # Assemble the final component data structure
+    logging.info("Assembling final component structure...")
+    for block in address_blocks if with_registers else []:
+        if block.getName() in all_registers:
+            if ipxact_version != "1685-2009":
+                register_list = block.getRegisterData()
+            else:
+                register_list = block.getRegister()
+            for reg in all_registers[block.getName()]:
+                register_list.add(reg)
+            logging.info(
+                f"Mapped {len(register_list)} registers to address block '{block.getName()}'."
+            )
+        else:
+            logging.warning(
+                f"No register block sheet found for address block '{block.getName()}'."
+            )
+
+    memory_map = object_factory.createMemoryMapType()
+    memory_map.setName(component.getName())
+    address_block_list = memory_map.getMemoryMap()
+    for block in address_blocks:
+        address_block_list.add(block)
+    memory_maps = object_factory.createMemoryMaps()
+    memory_map_list = memory_maps.getMemoryMap()
+    memory_map_list.add(memory_map)
+    component.setMemoryMaps(memory_maps)
+
+    return component
+
+
+def split_blocks(parsed: ParsedSheets) -> Iterator[tuple[str, ParsedSheets]]:
+    """Yield each address block with the ParsedSheets of that block alone.
+
+    The address map is partitioned once, so building every block from these only
+    processes each address map row and register sheet once.
+    """
+    if parsed.address_map is None:
+        raise ValueError("Failed to parse address blocks.")
+    address_rows = parsed.address_map.partition_by(
+        "BLOCK", as_dict=True, maintain_order=True
+    )
+    for (block_name,), address_map in address_rows.items():
+        block_name = str(block_name)
+        registers = (
+            {block_name: parsed.registers[block_name]}
+            if block_name in parsed.registers
+            else {}
+        )
+        yield block_name, ParsedSheets(parsed.vendor, address_map, registers)
+
+
+def build_block_component(
+    parsed: ParsedSheets, ipxact_version: str, block_name: str
+) -> Any:
+    """Build the component of a block from `split_blocks`, named `<name>_<block>`."""
+    component = build_component(parsed, ipxact_version)
+    component.setName(f"{component.getName()}_{block_name}")
+    return component
@@ -4,3 +4,4 @@ DEFAULT_VENDOR_SHEET = "version"
 DEFAULT_ADDRESS_SHEET = "address_map"
 DEFAULT_IPXACT_VERSION = "1685-2014"
 SCHEMA_JAR = "ipxact-schema-1.0.0.jar"
+CDS_ARCHIVE = "irgen.jsa"
@@ -0,0 +1,338 @@
+import json
+import logging
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from irgen.attribute import (
+    get_access_value,
+    get_modified_write_value,
+    get_read_action_value,
+)
+from irgen.parser import flatten_register_sheet, parse_number
+from irgen.reader import get_sheet_names, read_sheets
+from irgen.config import *
+
+BLOCK_KEYS = ["block"]
+REGISTER_KEYS = ["block", "register"]
+FIELD_KEYS = ["block", "register", "field"]
+BLOCK_SCHEMA = {
+    "block": pl.String,
+    "base_address": pl.Int64,
+    "range": pl.Int64,
+}
+REGISTER_SCHEMA = {
+    "block": pl.String,
+    "register": pl.String,
+    "address": pl.Int64,
+    "size": pl.Int64,
+}
+FIELD_SCHEMA = {
+    "block": pl.String,
+    "register": pl.String,
+    "field": pl.String,
+    "bit_offset": pl.Int64,
+    "bit_width": pl.Int64,
+    "access": pl.String,
+    "modified_write_value": pl.String,
+    "read_action": pl.String,
+    "reset": pl.Int64,
+}
+
+
+@dataclass
+class RegisterMap:
+    """A register map as frames keyed by block, (block, register) and
+    (block, register, field)."""
+
+    blocks: pl.DataFrame
+    registers: pl.DataFrame
+    fields: pl.DataFrame
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return int(value, 16) if value.lower().startswith("0x") else int(value)
+    except ValueError:
+        return None
+
+
+def _access_attributes(attribute: str | None) -> tuple[str | None, ...]:
+    try:
+        return (
+            get_access_value(str(attribute)),
+            get_modified_write_value(str(attribute)),
+            get_read_action_value(str(attribute)),
+        )
+    except KeyError:
+        logging.warning(f"Unknown field attribute '{attribute}'.")
+        return (None, None, None)
+
+
+def load_workbook(
+    excel_name: str,
+    vendor_sheet: str = DEFAULT_VENDOR_SHEET,
+    address_sheet: str = DEFAULT_ADDRESS_SHEET,
+) -> RegisterMap:
+    """Build a RegisterMap from a spreadsheet or a directory of tables.
+
+    Like the converter, only register sheets of blocks in the address map are
+    used, and sheets that fail pre-processing are logged and skipped.
+    """
+    sheet_names = [
+        sheet_name
+        for sheet_name in get_sheet_names(excel_name)
+        if sheet_name != vendor_sheet
+    ]
+    sheets = read_sheets(excel_name, sheet_names)
+    if address_sheet not in sheets:
+        raise ValueError("Failed to parse address blocks.")
+    blocks = (
+        sheets.pop(address_sheet)
+        .select(
+            block=pl.col("BLOCK").cast(pl.String),
+            base_address=parse_number(pl.col("OFFSET")),
+            range=parse_number(pl.col("RANGE")),
+        )
+        .unique(subset=BLOCK_KEYS, keep="last", maintain_order=True)
+    )
+
+    frames = []
+    for sheet_name, df in sheets.items():
+        if sheet_name not in blocks["block"]:
+            logging.warning(f"No address block found for sheet '{sheet_name}'.")
+            continue
+        try:
+            frames.append(
+                flatten_register_sheet(df).with_columns(BLOCK=pl.lit(sheet_name))
+            )
+        except pl.exceptions.PolarsError as e:
+            logging.error(
+                f"Polars error during pre-processing of sheet '{sheet_name}': {e}"
+            )
+    if not frames:
+        return RegisterMap(
+            blocks,
+            pl.DataFrame(schema=REGISTER_SCHEMA),
+            pl.DataFrame(schema=FIELD_SCHEMA),
+        )
+    fields_df = pl.concat(frames)
+
+    # The access attributes only depend on the (few) distinct ATTRIBUTE values
+    attributes = fields_df["ATTRIBUTE"].unique().to_list()
+    access_lookup = {
+        attribute: _access_attributes(attribute) for attribute in attributes
+    }
+    fields_df = fields_df.with_columns(
+        pl.col("ATTRIBUTE")
+        .replace_strict(
+            {attribute: values[i] for attribute, values in access_lookup.items()},
+            default=None,
+            return_dtype=pl.String,
+        )
+        .alias(name)
+        for i, name in enumerate(["access", "modified_write_value", "read_action"])
+    )
+
+    registers = (
+        fields_df.select(block="BLOCK", register="REG", address="ADDR", size="SIZE")
+        .unique(subset=REGISTER_KEYS, keep="last", maintain_order=True)
+        .cast(REGISTER_SCHEMA)
+    )
+    fields = (
+        fields_df.select(
+            block="BLOCK",
+            register="REG",
+            field="FIELD",
+            bit_offset="OFFSET",
+            bit_width="WIDTH",
+            access="access",
+            modified_write_value="modified_write_value",
+            read_action="read_action",
+            reset="DEFAULT",
+        )
+        .unique(subset=FIELD_KEYS, keep="last", maintain_order=True)
+        .cast(FIELD_SCHEMA)
+    )
+    return RegisterMap(blocks, registers, fields)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child(element: ET.Element, *path: str) -> ET.Element | None:
+    for name in path:
+        for child in element:
+            if _local_name(child.tag) == name:
+                element = child
+                break
+        else:
+            return None
+    return element
+
+
+def _child_text(element: ET.Element, *path: str) -> str | None:
+    child = _child(element, *path)
+    if child is None or child.text is None:
+        return None
+    return child.text.strip()
+
+
+def load_xml(xml_name: str) -> RegisterMap:
+    """Build a RegisterMap from a generated IP-XACT XML file (any supported version)."""
+    blocks: list[tuple] = []
+    registers: list[tuple] = []
+    fields: list[tuple] = []
+    for _, element in ET.iterparse(xml_name, events=("end",)):
+        if _local_name(element.tag) != "addressBlock":
+            continue
+        block_name = _child_text(element, "name") or ""
+        blocks.append(
+            (
+                block_name,
+                _parse_int(_child_text(element, "baseAddress")),
+                _parse_int(_child_text(element, "range")),
+            )
+        )
+        for reg in element:
+            if _local_name(reg.tag) != "register":
+                continue
+            reg_name = _child_text(reg, "name") or ""
+            reg_reset = _parse_int(_child_text(reg, "reset", "value"))
+            registers.append(
+                (
+                    block_name,
+                    reg_name,
+                    _parse_int(_child_text(reg, "addressOffset")),
+                    _parse_int(_child_text(reg, "size")),
+                )
+            )
+            for fld in reg:
+                if _local_name(fld.tag) != "field":
+                    continue
+                # 1685-2022 moves the access attributes under fieldAccessPolicies
+                policy = _child(fld, "fieldAccessPolicies", "fieldAccessPolicy")
+                if policy is None:
+                    policy = fld
+                offset = _parse_int(_child_text(fld, "bitOffset"))
+                width = _parse_int(_child_text(fld, "bitWidth"))
+                reset = _parse_int(_child_text(fld, "resets", "reset", "value"))
+                if reset is None and None not in (reg_reset, offset, width):
+                    # 1685-2009 only carries the reset value at register level
+                    reset = (reg_reset >> offset) & ((1 << width) - 1)
+                fields.append(
+                    (
+                        block_name,
+                        reg_name,
+                        _child_text(fld, "name") or "",
+                        offset,
+                        width,
+                        _child_text(policy, "access"),
+                        _child_text(policy, "modifiedWriteValue"),
+                        _child_text(policy, "readAction"),
+                        reset,
+                    )
+                )
+        element.clear()
+    return RegisterMap(
+        pl.DataFrame(blocks, schema=BLOCK_SCHEMA, orient="row").unique(
+            subset=BLOCK_KEYS, keep="last", maintain_order=True
+        ),
+        pl.DataFrame(registers, schema=REGISTER_SCHEMA, orient="row").unique(
+            subset=REGISTER_KEYS, keep="last", maintain_order=True
+        ),
+        pl.DataFrame(fields, schema=FIELD_SCHEMA, orient="row").unique(
+            subset=FIELD_KEYS, keep="last", maintain_order=True
+        ),
+    )
+
+
+def load_register_map(
+    path: str,
+    vendor_sheet: str = DEFAULT_VENDOR_SHEET,
+    address_sheet: str = DEFAULT_ADDRESS_SHEET,
+) -> RegisterMap:
+    """Load an Excel workbook, table directory or IP-XACT XML file into a RegisterMap."""
+    if Path(path).suffix.lower() == ".xml":
+        return load_xml(path)
+    return load_workbook(path, vendor_sheet, address_sheet)
+
+
+def _diff_frames(
+    old: pl.DataFrame, new: pl.DataFrame, keys: list[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Compare two frames with joins; only differing rows are turned into dicts."""
+    attributes = [name for name in old.columns if name not in keys]
+
+    def entries(df: pl.DataFrame) -> list[dict[str, Any]]:
+        return [
+            {"key": [row.pop(key) for key in keys], **row}
+            for row in df.sort(keys).to_dicts()
+        ]
+
+    changed_df = (
+        old.join(new, on=keys, how="inner", suffix="_new")
+        .filter(
+            pl.any_horizontal(
+                pl.col(name).ne_missing(pl.col(f"{name}_new")) for name in attributes
+            )
+        )
+        .sort(keys)
+    )
+    changed = []
+    for row in changed_df.to_dicts():
+        changed.append(
+            {
+                "key": [row[key] for key in keys],
+                "changes": {
+                    name: {"old": row[name], "new": row[f"{name}_new"]}
+                    for name in attributes
+                    if row[name] != row[f"{name}_new"]
+                },
+            }
+        )
+    return {
+        "added": entries(new.join(old, on=keys, how="anti")),
+        "removed": entries(old.join(new, on=keys, how="anti")),
+        "changed": changed,
+    }
+
+
+def diff_register_maps(old: RegisterMap, new: RegisterMap) -> dict[str, Any]:
+    """Compare two RegisterMaps, reporting added, removed and changed entries."""
+    return {
+        "blocks": _diff_frames(old.blocks, new.blocks, BLOCK_KEYS),
+        "registers": _diff_frames(old.registers, new.registers, REGISTER_KEYS),
+        "fields": _diff_frames(old.fields, new.fields, FIELD_KEYS),
+    }
+
+
+def has_differences(result: dict[str, Any]) -> bool:
+    return any(entries for index in result.values() for entries in index.values())
+
+
+def format_json(result: dict[str, Any]) -> str:
+    return json.dumps(result, indent=2)
+
+
+def format_text(result: dict[str, Any]) -> str:
+    lines = []
+    for kind, index in result.items():
+        for entry in index["added"]:
+            lines.append(f"+ {kind[:-1]} {'.'.join(entry['key'])}")
+        for entry in index["removed"]:
+            lines.append(f"- {kind[:-1]} {'.'.join(entry['key'])}")
+        for entry in index["changed"]:
+            changes = ", ".join(
+                f"{name}: {change['old']} -> {change['new']}"
+                for name, change in sorted(entry["changes"].items())
+            )
+            lines.append(f"~ {kind[:-1]} {'.'.join(entry['key'])} ({changes})")
+    return "\n".join(lines)
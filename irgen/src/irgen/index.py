@@ -0,0 +1,168 @@
+import re
+import json
+import logging
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+
+from irgen.builder import ParsedSheets
+from irgen.parser import flatten_registers, parse_number
+
+INDEX_SUFFIX = ".regidx"
+
+# Sorts after every other character, so `prefix + _MAX_CHAR` bounds a prefix range.
+_MAX_CHAR = "\U0010ffff"
+
+
+def get_index_path(xml_path: str) -> str:
+    return str(Path(xml_path).with_suffix(INDEX_SUFFIX))
+
+
+def build_index(parsed: ParsedSheets) -> pl.DataFrame:
+    """Build the lookup index of a parsed register map.
+
+    The index has one row per field, sorted by absolute address. The SORTED_NAME
+    and SORTED_ROW columns hold the dotted `block.register.field` names in sorted
+    order with their row numbers; together they act as a flattened name trie.
+    The names are not stored per row, and the few distinct BLOCK and ATTRIBUTE
+    values are categorical, to keep the index small.
+    """
+    if parsed.address_map is None:
+        raise ValueError("Failed to parse address blocks.")
+    block_offsets = parsed.address_map.select(
+        BLOCK=pl.col("BLOCK").cast(pl.String),
+        BASE=parse_number(pl.col("OFFSET")),
+    )
+
+    frames = []
+    for sheet_name, parsed_df in parsed.registers.items():
+        if parsed_df is None:
+            continue
+        if sheet_name not in block_offsets["BLOCK"]:
+            logging.warning(f"No address block found for sheet '{sheet_name}'.")
+            continue
+        frames.append(
+            flatten_registers(parsed_df).with_columns(BLOCK=pl.lit(sheet_name))
+        )
+    if not frames:
+        raise ValueError("No register sheets to index.")
+
+    index = (
+        pl.concat(frames)
+        .join(block_offsets, on="BLOCK", how="left")
+        .select(
+            pl.col("BLOCK").cast(pl.Categorical),
+            "REG",
+            "FIELD",
+            ADDRESS=pl.col("BASE") + pl.col("ADDR"),
+            SIZE=pl.col("SIZE").cast(pl.Int32),
+            OFFSET=pl.col("OFFSET").cast(pl.Int32),
+            WIDTH=pl.col("WIDTH").cast(pl.Int32),
+            ATTRIBUTE=pl.col("ATTRIBUTE").cast(pl.Categorical),
+            DEFAULT="DEFAULT",
+        )
+        .sort(["ADDRESS", "OFFSET"], descending=[False, True])
+    )
+    names = index.select(_field_name()).to_series()
+    name_order = names.arg_sort()
+    return index.with_columns(
+        SORTED_NAME=names.gather(name_order),
+        SORTED_ROW=name_order,
+    )
+
+
+def _field_name() -> pl.Expr:
+    return pl.concat_str(
+        [pl.col("BLOCK").cast(pl.String), "REG", "FIELD"], separator="."
+    ).alias("NAME")
+
+
+def write_index(index: pl.DataFrame, path: str):
+    # Uncompressed, so that `load_index` can memory-map it
+    index.write_ipc(path, compression="uncompressed")
+
+
+def load_index(path: str) -> pa.Table:
+    """Load an index written by `write_index` as a memory-mapped Arrow table.
+
+    The table is not converted to a polars DataFrame as a whole, since that would
+    copy its categorical columns. The lookups convert only the columns they search
+    (without copying) and the rows they return.
+    """
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def _column(index: pa.Table, name: str) -> pl.Series:
+    return pl.Series(name, pl.from_arrow(index.column(name)))
+
+
+def _take(index: pa.Table, rows: pl.Series) -> pl.DataFrame:
+    """Gather rows of the index; categorical columns are gathered before conversion."""
+    indices = rows.to_arrow()
+    return pl.DataFrame(
+        pl.Series(name, pl.from_arrow(index.column(name).take(indices)))
+        if pa.types.is_dictionary(index.schema.field(name).type)
+        else _column(index, name).gather(rows)
+        for name in index.column_names
+    )
+
+
+def lookup_address(index: pa.Table, address: int) -> pl.DataFrame:
+    """Return the fields of the register that contains `address`."""
+    addresses = _column(index, "ADDRESS")
+    end = addresses.search_sorted(address, side="right")
+    if end == 0:
+        return pl.from_arrow(index.slice(0, 0))
+    start = addresses.search_sorted(addresses[end - 1], side="left")
+    rows = pl.from_arrow(index.slice(start, end - start))
+    if address >= rows["ADDRESS"][0] + rows["SIZE"][0] // 8:
+        return rows.clear()
+    return rows
+
+
+def _glob_to_regex(pattern: str) -> str:
+    return (
+        "^"
+        + "".join(
+            ".*" if char == "*" else "." if char == "?" else re.escape(char)
+            for char in pattern
+        )
+        + "$"
+    )
+
+
+def lookup_name(index: pa.Table, pattern: str) -> pl.DataFrame:
+    """Return the fields whose `block.register.field` name matches a glob pattern.
+
+    The literal prefix of the pattern narrows the search to a range of the sorted
+    names before the pattern itself is matched.
+    """
+    prefix = re.split(r"[*?]", pattern, maxsplit=1)[0]
+    names = _column(index, "SORTED_NAME")
+    start = names.search_sorted(prefix, side="left")
+    end = names.search_sorted(prefix + _MAX_CHAR, side="right")
+    candidates = names.slice(start, end - start)
+    rows = _column(index, "SORTED_ROW").slice(start, end - start)
+    matches = rows.filter(candidates.str.contains(_glob_to_regex(pattern)))
+    return _take(index, matches.sort())
+
+
+def format_json(rows: pl.DataFrame) -> str:
+    return json.dumps(
+        rows.select(_field_name(), pl.exclude("SORTED_NAME", "SORTED_ROW")).to_dicts(),
+        indent=2,
+    )
+
+
+def format_text(rows: pl.DataFrame) -> str:
+    def hex_or_none(value: int | None, digits: int = 0) -> str:
+        return "None" if value is None else f"0x{value:0{digits}X}"
+
+    return "\n".join(
+        f"{hex_or_none(row['ADDRESS'], 8)} {row['BLOCK']}.{row['REG']}.{row['FIELD']} "
+        f"[{row['OFFSET'] + row['WIDTH'] - 1}:{row['OFFSET']}] "
+        f"{row['ATTRIBUTE']} reset={hex_or_none(row['DEFAULT'])}"
+        for row in rows.iter_rows(named=True)
+    )
@@ -1,11 +1,14 @@
 import sys
 import logging
+import threading
 from pathlib import Path
 
 import jpype
 
 from irgen.config import *
 
+_jvm_lock = threading.Lock()
+
 
 def is_bundled() -> bool:
     return hasattr(sys, "_MEIPASS")
@@ -59,3 +62,41 @@ def get_jvm_path() -> str:
             logging.warning("No custom JVM path provided, using default JVM path.")
 
     return jpype.getDefaultJVMPath()
+
+
+def get_cds_archive_path() -> Path | None:
+    """Location of the Class Data Sharing archive written by `irgen warmup`.
+
+    A one-file bundle extracts its class path to a new directory on every run, so
+    no archive can match it; bundles rely on the CDS archive of their jlink JRE
+    and this returns None.
+    """
+    if is_bundled():
+        return None
+    return (
+        Path(__file__).parent.parent.parent.parent / "schema" / "target" / CDS_ARCHIVE
+    ).resolve()
+
+
+def get_jvm_options() -> list[str]:
+    archive_path = get_cds_archive_path()
+    if archive_path is None or not archive_path.exists():
+        return []
+    logging.debug(f"cds_archive_path: {archive_path}")
+    # The JVM ignores the archive if it does not match the JVM or class path
+    return [f"-XX:SharedArchiveFile={archive_path}", "-Xshare:auto"]
+
+
+def start_jvm(*options: str, use_cds_archive: bool = True) -> None:
+    """Start the JVM with the schema class path, unless it is already running."""
+    with _jvm_lock:
+        if jpype.isJVMStarted():
+            return
+        logging.debug("Starting JVM...")
+        jpype.startJVM(
+            *(get_jvm_options() if use_cds_archive else []),
+            *options,
+            jvmpath=get_jvm_path(),
+            classpath=get_class_path(),
+        )
+        logging.debug("JVM Started.")
@@ -1,21 +1,27 @@
 import sys
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
 
-import polars as pl
 import fastexcel
 import jpype
 
 from irgen.__version__ import __version__
-from irgen.jpath import get_class_path, get_jvm_path
-from irgen.parser import (
-    process_vendor_sheet,
-    process_address_map_sheet,
-    process_register_sheet,
-)
+from irgen.jpath import start_jvm
+from irgen.builder import SUPPORTED_IPXACT_VERSIONS, build_component, parse_sheets
+from irgen.reader import get_sheet_names, read_sheets
+from irgen.shard import generate_sharded_xml
+from irgen.warmup import create_cds_archive
+from irgen import index
 from irgen.template import generate_template
+from irgen.diff import (
+    load_register_map,
+    diff_register_maps,
+    has_differences,
+    format_json,
+    format_text,
+)
 from irgen.config import *
 
 
@@ -57,7 +63,11 @@ def setup_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-e",
         "--excel",
-        help="Path to the input excel file.",
+        "-i",
+        "--input",
+        dest="excel",
+        help="Path to the input excel file, or a directory of Parquet, Arrow IPC "
+        "or CSV tables named after the sheets.",
     )
     parser.add_argument(
         "-o",
@@ -77,11 +87,185 @@ def setup_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--ipxact-version",
         default=DEFAULT_IPXACT_VERSION,
-        help="IP-XACT version to use (e.g., 1685-2009, 1685-2014, 1685-2022)",
+        help="IP-XACT version to use (e.g., 1685-2009, 1685-2014, 1685-2022). "
+        "A comma-separated list generates one XML file per version.",
+    )
+    parser.add_argument(
+        "--shard-by-block",
+        action="store_true",
+        help="Write each address block to its own XML file, next to a top-level "
+        "component holding the memory map.",
+    )
+    parser.add_argument(
+        "--shard-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="With --shard-by-block, hold at most N built blocks at once and "
+        "marshal them on N-1 threads (default: the number of CPUs). Lower it "
+        "to reduce the JVM heap.",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help=f"Also write an address lookup index (<output>{index.INDEX_SUFFIX}) "
+        "for `irgen lookup`.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    diff_parser = subparsers.add_parser(
+        "diff",
+        help="Compare two register maps (Excel or IP-XACT XML) without the JVM.",
+        description="Report added, removed and changed registers and fields. "
+        "Exits with 1 if the register maps differ, 2 on errors.",
+    )
+    diff_parser.add_argument("old", help="Path to the old Excel or XML file.")
+    diff_parser.add_argument("new", help="Path to the new Excel or XML file.")
+    diff_parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format.",
+    )
+    diff_parser.add_argument(
+        "--vendor-sheet",
+        default=DEFAULT_VENDOR_SHEET,
+        help="Name of the vendor sheet.",
+    )
+    diff_parser.add_argument(
+        "--address-sheet",
+        default=DEFAULT_ADDRESS_SHEET,
+        help="Name of the address map sheet.",
+    )
+
+    lookup_parser = subparsers.add_parser(
+        "lookup",
+        help="Find registers and fields by address or name in a lookup index.",
+        description="Query an index written with --index. "
+        "Exits with 1 if nothing matches, 2 on errors.",
+    )
+    lookup_parser.add_argument(
+        "address",
+        nargs="?",
+        help="Absolute address to look up (hexadecimal with 0x, or decimal).",
+    )
+    lookup_parser.add_argument(
+        "-n",
+        "--name",
+        help="Glob pattern matched against 'block.register.field' names.",
+    )
+    lookup_parser.add_argument(
+        "-x",
+        "--index",
+        dest="index_path",
+        help=f"Path to the index file. Defaults to the only *{index.INDEX_SUFFIX} "
+        "file in the current directory.",
+    )
+    lookup_parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format.",
+    )
+
+    warmup_parser = subparsers.add_parser(
+        "warmup",
+        help="Create a Class Data Sharing archive to speed up JVM startup.",
+        description="Run a sample conversion and archive the loaded Java classes. "
+        "Later runs load the archive automatically.",
+    )
+    warmup_parser.add_argument(
+        "-o",
+        "--output",
+        dest="archive_path",
+        help=f"Path for the archive. Defaults to {CDS_ARCHIVE} next to the schema "
+        "JAR, where it is picked up automatically.",
     )
     return parser
 
 
+def get_xml_paths(
+    excel_name: str, output: str | None, ipxact_versions: list[str]
+) -> dict[str, str]:
+    """Map each IP-XACT version to its output path.
+
+    With several versions, the version is appended to the file name, e.g.
+    `example_1685-2014.xml`.
+    """
+    xml_path = Path(output) if output else Path(f"{Path(excel_name).stem}.xml")
+    if len(ipxact_versions) == 1:
+        return {ipxact_versions[0]: str(xml_path)}
+    return {
+        version: str(xml_path.with_name(f"{xml_path.stem}_{version}{xml_path.suffix}"))
+        for version in ipxact_versions
+    }
+
+
+def run_lookup(args: argparse.Namespace) -> int:
+    """Run the `lookup` sub-command and return the process exit code."""
+    if (args.address is None) == (args.name is None):
+        logging.critical("Give either an address or --name.")
+        return 2
+
+    index_path = args.index_path
+    if index_path is None:
+        candidates = list(Path.cwd().glob(f"*{index.INDEX_SUFFIX}"))
+        if len(candidates) != 1:
+            logging.critical(
+                f"Found {len(candidates)} *{index.INDEX_SUFFIX} files, use --index."
+            )
+            return 2
+        index_path = str(candidates[0])
+
+    try:
+        lookup_index = index.load_index(index_path)
+        if args.name is not None:
+            rows = index.lookup_name(lookup_index, args.name)
+        else:
+            address = args.address.strip()
+            rows = index.lookup_address(
+                lookup_index,
+                int(address, 16) if address.lower().startswith("0x") else int(address),
+            )
+    except Exception as e:
+        logging.critical(f"Could not look up '{args.address or args.name}': {e}")
+        return 2
+
+    if args.format == "json":
+        print(index.format_json(rows))
+    elif not rows.is_empty():
+        print(index.format_text(rows))
+    return 0 if not rows.is_empty() else 1
+
+
+def run_warmup(args: argparse.Namespace) -> int:
+    """Run the `warmup` sub-command and return the process exit code."""
+    try:
+        archive_path = create_cds_archive(args.archive_path)
+    except Exception as e:
+        logging.critical(f"Could not create the CDS archive: {e}")
+        return 1
+    logging.info(f"CDS archive written to: {archive_path}")
+    return 0
+
+
+def run_diff(args: argparse.Namespace) -> int:
+    """Run the `diff` sub-command and return the process exit code."""
+    try:
+        old = load_register_map(args.old, args.vendor_sheet, args.address_sheet)
+        new = load_register_map(args.new, args.vendor_sheet, args.address_sheet)
+    except Exception as e:
+        logging.critical(f"Could not load register maps: {e}")
+        return 2
+
+    result = diff_register_maps(old, new)
+    if args.format == "json":
+        print(format_json(result))
+    elif has_differences(result):
+        print(format_text(result))
+    return 1 if has_differences(result) else 0
+
+
 def main():
     parser = setup_arg_parser()
     args = parser.parse_args()
@@ -91,6 +275,15 @@ def main():
         print(__version__)
         sys.exit(0)
 
+    if args.command == "diff":
+        sys.exit(run_diff(args))
+
+    if args.command == "lookup":
+        sys.exit(run_lookup(args))
+
+    if args.command == "warmup":
+        sys.exit(run_warmup(args))
+
     if args.template:
         generate_template()
         sys.exit(0)
@@ -101,113 +294,81 @@ def main():
             "Hint: Use -t or --template to generate an example Excel file."
         )
 
-    excel_name = str(args.excel)
+    if args.shard_workers is not None and args.shard_workers < 1:
+        parser.error("--shard-workers must be at least 1.")
 
-    if args.output:
-        xml_path = str(args.output)
-    else:
-        xml_path = str(f"{Path(args.excel).stem}.xml")
+    excel_name = str(args.excel)
 
     vendor_sheet = str(args.vendor_sheet)
     address_sheet = str(args.address_sheet)
-    ipxact_version = str(args.ipxact_version)
+    ipxact_versions = list(
+        dict.fromkeys(v.strip() for v in str(args.ipxact_version).split(","))
+    )
 
-    if ipxact_version not in ["1685-2009", "1685-2014", "1685-2022"]:
-        logging.critical(f"Unsupported IP-XACT version: {ipxact_version}!")
-        sys.exit(1)
+    for ipxact_version in ipxact_versions:
+        if ipxact_version not in SUPPORTED_IPXACT_VERSIONS:
+            logging.critical(f"Unsupported IP-XACT version: {ipxact_version}!")
+            sys.exit(1)
+
+    xml_paths = get_xml_paths(excel_name, args.output, ipxact_versions)
 
     try:
-        sheet_names = fastexcel.read_excel(excel_name).sheet_names
-    except (fastexcel.FastExcelError, FileNotFoundError) as e:
+        sheet_names = get_sheet_names(excel_name)
+    except (fastexcel.FastExcelError, FileNotFoundError, ValueError) as e:
         logging.critical(f"Could not read Excel file '{excel_name}': {e}")
         sys.exit(1)
 
     try:
-        logging.debug("Starting JVM...")
-        jpype.startJVM(jvmpath=get_jvm_path(), classpath=get_class_path())
-        logging.debug("JVM Started.")
-
-        # import Java classes
-        match ipxact_version:
-            case "1685-2009":
-                ObjectFactory = jpype.JClass("org.ieee.ipxact.v2009.ObjectFactory")
-            case "1685-2014":
-                ObjectFactory = jpype.JClass("org.ieee.ipxact.v2014.ObjectFactory")
-            case "1685-2022":
-                ObjectFactory = jpype.JClass("org.ieee.ipxact.v2022.ObjectFactory")
-            case _:
-                logging.critical(f"Unsupported IP-XACT version: {ipxact_version}")
-                sys.exit(1)
+        start_jvm()
 
         XmlGenerator = jpype.JClass("org.example.XmlGenerator")
         IpXactVersion = jpype.JClass("org.example.IpXactVersion")
 
         logging.debug("Java classes imported successfully.")
 
-        object_factory = ObjectFactory()
-        component = None
-        address_blocks: list[Any] = []
-        all_registers: dict[str, list[Any]] = {}
-
         logging.info(f"Processing sheets: {sheet_names}")
-        for sheet_name in sheet_names:
-            logging.info(f"--- Reading sheet: {sheet_name} ---")
-            try:
-                df = pl.read_excel(excel_name, sheet_name=sheet_name)
-            except Exception as e:
-                logging.error(f"Could not read sheet '{sheet_name}' with Polars: {e}")
-                continue
-
-            if sheet_name == vendor_sheet:
-                component = process_vendor_sheet(df, object_factory)
-            elif sheet_name == address_sheet:
-                address_blocks = process_address_map_sheet(
-                    df, object_factory, ipxact_version
-                )
-            else:
-                all_registers[sheet_name] = process_register_sheet(
-                    df, object_factory, ipxact_version
-                )
+        sheets = read_sheets(excel_name, sheet_names)
+        # Parse once; only building the Java objects depends on the version
+        parsed = parse_sheets(sheets, vendor_sheet, address_sheet)
 
-        if not component:
-            logging.critical("Failed to parse vendor information. Aborting.")
-            sys.exit(1)
-        if not address_blocks:
-            logging.critical("Failed to parse address blocks. Aborting.")
-            sys.exit(1)
+        if args.index:
+            index_path = index.get_index_path(
+                args.output or f"{Path(excel_name).stem}.xml"
+            )
+            logging.info(f"Lookup index will be generated at: {index_path}")
+            index.write_index(index.build_index(parsed), index_path)
 
-        # Assemble the final component data structure
-        logging.info("Assembling final component structure...")
-        for block in address_blocks:
-            if block.getName() in all_registers:
-                if ipxact_version != "1685-2009":
-                    register_list = block.getRegisterData()
-                else:
-                    register_list = block.getRegister()
-                for reg in all_registers[block.getName()]:
-                    register_list.add(reg)
-                logging.info(
-                    f"Mapped {len(register_list)} registers to address block '{block.getName()}'."
-                )
-            else:
-                logging.warning(
-                    f"No register block sheet found for address block '{block.getName()}'."
+        if args.shard_by_block:
+            for ipxact_version in ipxact_versions:
+                generate_sharded_xml(
+                    parsed,
+                    ipxact_version,
+                    xml_paths[ipxact_version],
+                    max_workers=args.shard_workers,
                 )
+            return
 
-        memory_map = object_factory.createMemoryMapType()
-        memory_map.setName(component.getName())
-        address_block_list = memory_map.getMemoryMap()
-        for block in address_blocks:
-            address_block_list.add(block)
-        memory_maps = object_factory.createMemoryMaps()
-        memory_map_list = memory_maps.getMemoryMap()
-        memory_map_list.add(memory_map)
-        component.setMemoryMaps(memory_maps)
-
-        logging.info(f"XML file will be generated at: {xml_path}")
-        XmlGenerator.generateXml(
-            component, IpXactVersion.fromValue(ipxact_version), xml_path
-        )
+        components = {
+            ipxact_version: build_component(parsed, ipxact_version)
+            for ipxact_version in ipxact_versions
+        }
+
+        # Marshalling runs entirely in Java, so the versions are written in parallel
+        with ThreadPoolExecutor(max_workers=len(components)) as executor:
+            futures = []
+            for ipxact_version, component in components.items():
+                xml_path = xml_paths[ipxact_version]
+                logging.info(f"XML file will be generated at: {xml_path}")
+                futures.append(
+                    executor.submit(
+                        XmlGenerator.generateXml,
+                        component,
+                        IpXactVersion.fromValue(ipxact_version),
+                        xml_path,
+                    )
+                )
+            for future in futures:
+                future.result()
 
     except Exception as e:
         logging.critical(f"An error occurred during processing: {e}")
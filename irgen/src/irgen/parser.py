@@ -85,8 +85,57 @@ def parse_dataframe(df: pl.DataFrame) -> pl.DataFrame:
     return parsed_df
 
 
-def process_vendor_sheet(df: pl.DataFrame, object_factory: Any) -> Any:
-    """Process the Sheet<vendor> to create an IP-XACT Component object"""
+def parse_number(expr: pl.Expr) -> pl.Expr:
+    """Convert a "0x" prefixed hexadecimal or plain decimal string column to Int64."""
+    text = expr.cast(pl.String).str.strip_chars()
+    return (
+        pl.when(text.str.to_lowercase().str.starts_with("0x"))
+        .then(text.str.slice(2).str.to_integer(base=16, strict=False))
+        .otherwise(text.str.to_integer(base=10, strict=False))
+    )
+
+
+def flatten_register_sheet(df: pl.DataFrame) -> pl.DataFrame:
+    """Flatten a register block sheet into one row per (non-reserved) field.
+
+    Unlike `process_register_sheet`, this does not need the JVM, so it can be used
+    by tooling that only inspects the register map.
+    """
+    return flatten_registers(preprocess_register_sheet(df))
+
+
+def flatten_registers(parsed_df: pl.DataFrame) -> pl.DataFrame:
+    """Flatten a sheet pre-processed by `preprocess_register_sheet`."""
+    return (
+        parsed_df.filter(
+            ~pl.col("FIELD").cast(pl.String).str.contains(r"^(rsvd|reserved)\d*$")
+        )
+        .with_columns(
+            ADDR=parse_number(pl.col("ADDR")),
+            SIZE=pl.col("stride").cast(pl.Int64) * 8,
+            OFFSET=pl.col("BIT")
+            .cast(pl.String)
+            .str.extract(r"\[(?:\d+:)?(\d+)]", 1)
+            .cast(pl.Int64),
+            WIDTH=pl.col("WIDTH").cast(pl.Int64),
+            ATTRIBUTE=pl.col("ATTRIBUTE").cast(pl.String),
+            DEFAULT=parse_number(pl.col("DEFAULT")),
+        )
+        # build_registers skips fields whose BIT cannot be parsed, so drop them too
+        .filter(pl.col("OFFSET").is_not_null())
+        .select(
+            "REG", "ADDR", "SIZE", "FIELD", "OFFSET", "WIDTH", "ATTRIBUTE", "DEFAULT"
+        )
+    )
+
+
+def process_vendor_sheet(
+    df: pl.DataFrame, object_factory: Any, strict: bool = False
+) -> Any:
+    """Process the Sheet<vendor> to create an IP-XACT Component object
+
+    Errors are logged and None is returned, or with `strict`, they are raised.
+    """
     try:
 
         def get_tag_value(tag: str) -> str:
@@ -103,9 +152,13 @@ def process_vendor_sheet(df: pl.DataFrame, object_factory: Any) -> Any:
 
         return component
     except (pl.exceptions.PolarsError, ValueError, KeyError) as e:
+        if strict:
+            raise
         logging.error(f"Failed to process the Sheet<vendor>: {e}")
         return None
     except Exception as e:
+        if strict:
+            raise
         logging.error(
             f"An unexpected error occurred while processing the Sheet<vendor>: {e}"
         )
@@ -113,9 +166,12 @@ def process_vendor_sheet(df: pl.DataFrame, object_factory: Any) -> Any:
 
 
 def process_address_map_sheet(
-    df: pl.DataFrame, object_factory: Any, ipxact_version: str
+    df: pl.DataFrame, object_factory: Any, ipxact_version: str, strict: bool = False
 ) -> list[Any]:
-    """Process the Sheet<address_map> to create a list of IP-XACT AddressBlock objects."""
+    """Process the Sheet<address_map> to create a list of IP-XACT AddressBlock objects.
+
+    Rows with missing columns are logged and skipped, or with `strict`, raised.
+    """
 
     if not jpype.isJVMStarted():
         raise
@@ -150,16 +206,52 @@ def process_address_map_sheet(
             address_block.setWidth(width)
             address_blocks.append(address_block)
         except KeyError as e:
+            if strict:
+                raise
             logging.error(
                 f"Missing expected column in address_map sheet: {e}. Skipping row: {row}"
             )
     return address_blocks
 
 
+def preprocess_register_sheet(df: pl.DataFrame) -> pl.DataFrame:
+    """Forward-fill a register block sheet and expand its register arrays."""
+    filled_df = df.select(pl.all().forward_fill())
+    logging.debug(f"filled_df is {filled_df}")
+    parsed_df = parse_dataframe(filled_df)
+    logging.debug(f"parsed_df is {parsed_df}")
+    return parsed_df
+
+
 def process_register_sheet(
-    df: pl.DataFrame, object_factory: Any, ipxact_version: str
+    df: pl.DataFrame,
+    object_factory: Any,
+    ipxact_version: str,
+    share_fields: bool = True,
 ) -> list[Any]:
     """Process a single register block sheet into a list of Register objects."""
+    try:
+        parsed_df = preprocess_register_sheet(df)
+    except pl.exceptions.PolarsError as e:
+        logging.error(f"Polars error during pre-processing of a register sheet: {e}")
+        return []
+    return build_registers(parsed_df, object_factory, ipxact_version, share_fields)
+
+
+def build_registers(
+    parsed_df: pl.DataFrame,
+    object_factory: Any,
+    ipxact_version: str,
+    share_fields: bool = True,
+    strict: bool = False,
+) -> list[Any]:
+    """Build Register objects from a sheet pre-processed by `preprocess_register_sheet`.
+
+    With `share_fields`, fields with identical attributes (e.g. those of expanded
+    `rega{n}` instances) are created once and shared between registers. Invalid
+    fields and rows without a register name are logged and skipped, or with
+    `strict`, raised.
+    """
 
     if not jpype.isJVMStarted():
         raise
@@ -184,20 +276,13 @@ def process_register_sheet(
 
     BigInteger = jpype.JClass("java.math.BigInteger")
 
-    try:
-        # Pre-process the dataframe
-        filled_df = df.select(pl.all().forward_fill())
-        logging.debug(f"filled_df is {filled_df}")
-        parsed_df = parse_dataframe(filled_df)
-        logging.debug(f"parsed_df is {parsed_df}")
-    except pl.exceptions.PolarsError as e:
-        logging.error(f"Polars error during pre-processing of a register sheet: {e}")
-        return []
-
     registers = []
+    field_cache: dict[tuple[str, ...], Any] = {}
     # Group by register to process all its fields together
     for reg_name, group in parsed_df.group_by("REG", maintain_order=True):
         if not reg_name:
+            if strict:
+                raise ValueError("Found rows with no register name.")
             logging.warning("Skipping rows with no register name.")
             continue
 
@@ -217,91 +302,107 @@ def process_register_sheet(
                 if re.match(r"^(rsvd|reserved)\d*$", str(field_row["FIELD"])):
                     continue
 
-                field = object_factory.createFieldType()
-                if ipxact_version != "1685-2009":
-                    bit_offset = object_factory.createUnsignedIntExpression()
-                    bit_offset.setValue(str(bit_match[0]))
-                if ipxact_version != "1685-2009":
-                    bit_width = object_factory.createUnsignedPositiveIntExpression()
-                    bit_width.setValue(str(field_row["WIDTH"]))
-                else:
-                    bit_width = object_factory.createFieldTypeBitWidth()
-                    bit_width.setValue(BigInteger.valueOf(int(field_row["WIDTH"])))
-                field.setName(str(field_row["FIELD"]))
-                if ipxact_version != "1685-2009":
-                    field.setBitOffset(bit_offset)
-                else:
-                    field.setBitOffset(BigInteger.valueOf(int(bit_match[0])))
-                field.setBitWidth(bit_width)
-                if ipxact_version == "1685-2022":
-                    access_policies = (
-                        object_factory.createFieldTypeFieldAccessPolicies()
-                    )
-                    access_policy = object_factory.createFieldTypeFieldAccessPoliciesFieldAccessPolicy()
-                    access_policy_list = access_policies.getFieldAccessPolicy()
-                if (
-                    access_value := get_access_value(str(field_row["ATTRIBUTE"]))
-                ) is not None:
-                    if ipxact_version == "1685-2022":
-                        access_policy.setAccess(AccessType.fromValue(access_value))
+                # Array instances share identical fields, so reuse the Java sub-tree
+                field_key = (
+                    str(field_row["FIELD"]),
+                    bit_match[0],
+                    str(field_row["WIDTH"]),
+                    str(field_row["ATTRIBUTE"]),
+                    str(field_row["DEFAULT"]),
+                )
+                field = field_cache.get(field_key) if share_fields else None
+                if field is None:
+                    field = object_factory.createFieldType()
+                    if ipxact_version != "1685-2009":
+                        bit_offset = object_factory.createUnsignedIntExpression()
+                        bit_offset.setValue(str(bit_match[0]))
+                    if ipxact_version != "1685-2009":
+                        bit_width = object_factory.createUnsignedPositiveIntExpression()
+                        bit_width.setValue(str(field_row["WIDTH"]))
                     else:
-                        field.setAccess(AccessType.fromValue(access_value))
-                if (
-                    modified_write_value := get_modified_write_value(
-                        str(field_row["ATTRIBUTE"])
-                    )
-                ) is not None:
-                    if ipxact_version == "1685-2022":
-                        modified_write = object_factory.createModifiedWriteValue()
-                    elif ipxact_version == "1685-2014":
-                        modified_write = (
-                            object_factory.createFieldTypeModifiedWriteValue()
-                        )
+                        bit_width = object_factory.createFieldTypeBitWidth()
+                        bit_width.setValue(BigInteger.valueOf(int(field_row["WIDTH"])))
+                    field.setName(str(field_row["FIELD"]))
                     if ipxact_version != "1685-2009":
-                        modified_write.setValue(
-                            ModifiedWriteValueType.fromValue(modified_write_value)
-                        )
-                    if ipxact_version == "1685-2022":
-                        access_policy.setModifiedWriteValue(modified_write)
-                    elif ipxact_version == "1685-2014":
-                        field.setModifiedWriteValue(modified_write)
+                        field.setBitOffset(bit_offset)
                     else:
-                        field.setModifiedWriteValue(modified_write_value)
-                if (
-                    read_action_value := get_read_action_value(
-                        str(field_row["ATTRIBUTE"])
-                    )
-                ) is not None:
+                        field.setBitOffset(BigInteger.valueOf(int(bit_match[0])))
+                    field.setBitWidth(bit_width)
                     if ipxact_version == "1685-2022":
-                        read_action = object_factory.createReadAction()
-                    elif ipxact_version == "1685-2014":
-                        read_action = object_factory.createFieldTypeReadAction()
-                    if ipxact_version != "1685-2009":
-                        read_action.setValue(
-                            ReadActionType.fromValue(read_action_value)
+                        access_policies = (
+                            object_factory.createFieldTypeFieldAccessPolicies()
+                        )
+                        access_policy = object_factory.createFieldTypeFieldAccessPoliciesFieldAccessPolicy()
+                        access_policy_list = access_policies.getFieldAccessPolicy()
+                    if (
+                        access_value := get_access_value(str(field_row["ATTRIBUTE"]))
+                    ) is not None:
+                        if ipxact_version == "1685-2022":
+                            access_policy.setAccess(AccessType.fromValue(access_value))
+                        else:
+                            field.setAccess(AccessType.fromValue(access_value))
+                    if (
+                        modified_write_value := get_modified_write_value(
+                            str(field_row["ATTRIBUTE"])
+                        )
+                    ) is not None:
+                        if ipxact_version == "1685-2022":
+                            modified_write = object_factory.createModifiedWriteValue()
+                        elif ipxact_version == "1685-2014":
+                            modified_write = (
+                                object_factory.createFieldTypeModifiedWriteValue()
+                            )
+                        if ipxact_version != "1685-2009":
+                            modified_write.setValue(
+                                ModifiedWriteValueType.fromValue(modified_write_value)
+                            )
+                        if ipxact_version == "1685-2022":
+                            access_policy.setModifiedWriteValue(modified_write)
+                        elif ipxact_version == "1685-2014":
+                            field.setModifiedWriteValue(modified_write)
+                        else:
+                            field.setModifiedWriteValue(modified_write_value)
+                    if (
+                        read_action_value := get_read_action_value(
+                            str(field_row["ATTRIBUTE"])
                         )
+                    ) is not None:
+                        if ipxact_version == "1685-2022":
+                            read_action = object_factory.createReadAction()
+                        elif ipxact_version == "1685-2014":
+                            read_action = object_factory.createFieldTypeReadAction()
+                        if ipxact_version != "1685-2009":
+                            read_action.setValue(
+                                ReadActionType.fromValue(read_action_value)
+                            )
+                        if ipxact_version == "1685-2022":
+                            access_policy.setReadAction(read_action)
+                        elif ipxact_version == "1685-2014":
+                            field.setReadAction(read_action)
+                        else:
+                            field.setReadAction(read_action_value)
                     if ipxact_version == "1685-2022":
-                        access_policy.setReadAction(read_action)
-                    elif ipxact_version == "1685-2014":
-                        field.setReadAction(read_action)
-                    else:
-                        field.setReadAction(read_action_value)
-                if ipxact_version == "1685-2022":
-                    access_policy_list.add(access_policy)
-                    field.setFieldAccessPolicies(access_policies)
-                if ipxact_version != "1685-2009":
-                    resets = object_factory.createFieldTypeResets()
-                    reset = object_factory.createReset()
-                    reset_value = object_factory.createUnsignedBitVectorExpression()
-                    reset_value.setValue(str(field_row["DEFAULT"]))
-                    reset.setValue(reset_value)
-                    reset_list = resets.getReset()
-                    reset_list.add(reset)
-                    field.setResets(resets)
+                        access_policy_list.add(access_policy)
+                        field.setFieldAccessPolicies(access_policies)
+                    if ipxact_version != "1685-2009":
+                        resets = object_factory.createFieldTypeResets()
+                        reset = object_factory.createReset()
+                        reset_value = object_factory.createUnsignedBitVectorExpression()
+                        reset_value.setValue(str(field_row["DEFAULT"]))
+                        reset.setValue(reset_value)
+                        reset_list = resets.getReset()
+                        reset_list.add(reset)
+                        field.setResets(resets)
+                    if share_fields:
+                        field_cache[field_key] = field
                 fields.append(field)
 
                 total_field_reset += int(field_row["DEFAULT"], 16) << int(bit_match[0])
             except (KeyError, ValueError, TypeError) as e:
+                if strict:
+                    raise ValueError(
+                        f"Invalid field '{field_row.get('FIELD', 'N/A')}' in register '{reg_name[0]}': {e}"
+                    ) from e
                 logging.error(
                     f"Skipping invalid field '{field_row.get('FIELD', 'N/A')}' in register '{reg_name[0]}': {e}"
                 )
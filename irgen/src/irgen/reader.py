@@ -0,0 +1,114 @@
+import logging
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+import fastexcel
+
+TABLE_SUFFIXES = {
+    ".parquet": "parquet",
+    ".arrow": "ipc",
+    ".ipc": "ipc",
+    ".feather": "ipc",
+    ".csv": "csv",
+}
+
+
+Source = str | bytes
+
+
+def is_table_dir(source: Source) -> bool:
+    return isinstance(source, str) and Path(source).is_dir()
+
+
+def _table_files(source: Source) -> dict[str, Path]:
+    tables: dict[str, Path] = {}
+    for path in sorted(Path(source).iterdir()):
+        if path.suffix.lower() not in TABLE_SUFFIXES:
+            continue
+        if path.stem in tables:
+            raise ValueError(
+                f"Table '{path.stem}' is ambiguous in '{source}': "
+                f"both {tables[path.stem].name} and {path.name} exist"
+            )
+        tables[path.stem] = path
+    if not tables:
+        raise FileNotFoundError(
+            f"No {', '.join(TABLE_SUFFIXES)} tables found in '{source}'"
+        )
+    return tables
+
+
+def get_sheet_names(source: Source) -> list[str]:
+    """List the sheets of an Excel file (path or bytes), or the tables of a directory."""
+    if is_table_dir(source):
+        return list(_table_files(source))
+    return fastexcel.read_excel(source).sheet_names
+
+
+def _normalize(df: pl.DataFrame) -> pl.DataFrame:
+    """Match the column types `pl.read_excel` yields for the register templates."""
+    casts = [
+        pl.col(name).cast(pl.Int64 if name == "WIDTH" else pl.String)
+        for name, dtype in df.schema.items()
+        if dtype != (pl.Int64 if name == "WIDTH" else pl.String)
+    ]
+    return df.with_columns(casts) if casts else df
+
+
+def read_ipc_mapped(path: str | Path) -> pl.DataFrame:
+    """Read an Arrow IPC file through a memory map, without copying its data.
+
+    `pl.read_ipc` copies the whole file into memory. The frame returned here keeps
+    the file mapped instead, so only the pages that are used are read. Compressed
+    files are decompressed into memory.
+    """
+    with pa.memory_map(str(path)) as source:
+        return pl.from_arrow(pa.ipc.open_file(source).read_all())
+
+
+def read_sheet(
+    source: Source, sheet_name: str, tables: dict[str, Path] | None = None
+) -> pl.DataFrame:
+    """Read one sheet of an Excel file, or one table of a directory.
+
+    `tables` is the directory listing from `_table_files`; pass it when reading
+    several tables to avoid listing the directory again. Arrow IPC tables are
+    memory-mapped, and columns that already have the expected type (String, or
+    Int64 for WIDTH) are used without copying.
+    """
+    if not is_table_dir(source):
+        return pl.read_excel(source, sheet_name=sheet_name)
+
+    path = (tables or _table_files(source))[sheet_name]
+    logging.debug(f"Reading table '{sheet_name}' from {path}")
+    match TABLE_SUFFIXES[path.suffix.lower()]:
+        case "parquet":
+            df = pl.read_parquet(path)
+        case "ipc":
+            df = read_ipc_mapped(path)
+        case _:
+            df = pl.read_csv(path, infer_schema=False)
+    return _normalize(df)
+
+
+def read_sheets(
+    source: Source, sheet_names: list[str] | None = None, strict: bool = False
+) -> dict[str, pl.DataFrame]:
+    """Read all sheets of a source, skipping (and logging) unreadable ones.
+
+    With `strict`, the error of an unreadable sheet is raised instead.
+    """
+    tables = _table_files(source) if is_table_dir(source) else None
+    sheets = {}
+    for sheet_name in sheet_names or (
+        list(tables) if tables else get_sheet_names(source)
+    ):
+        logging.info(f"--- Reading sheet: {sheet_name} ---")
+        try:
+            sheets[sheet_name] = read_sheet(source, sheet_name, tables)
+        except Exception as e:
+            if strict:
+                raise
+            logging.error(f"Could not read sheet '{sheet_name}' with Polars: {e}")
+    return sheets
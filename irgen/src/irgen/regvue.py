@@ -95,4 +95,6 @@ class IncludeElement(BaseModel):
 class DocumentObject(BaseModel):
     schema_: SchemaObject = Field(..., alias="schema")
     root: RootObject = Field(...)
-    elements: Dict[str, BlockElement | RegisterElement | MemoryElement | IncludeElement] = Field(...)
+    elements: Dict[
+        str, BlockElement | RegisterElement | MemoryElement | IncludeElement
+    ] = Field(...)
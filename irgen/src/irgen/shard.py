@@ -0,0 +1,105 @@
+import os
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+import jpype
+
+from irgen.builder import (
+    ParsedSheets,
+    build_block_component,
+    build_component,
+    get_object_factory,
+    split_blocks,
+)
+
+SHARD_NAMESPACE = "https://github.com/BeriBeli/ipxact-register-generator/shard"
+
+
+def get_shard_path(xml_path: str, block_name: str) -> str:
+    path = Path(xml_path)
+    return str(path.with_name(f"{path.stem}_{block_name}{path.suffix}"))
+
+
+def add_shard_references(component: Any, ipxact_version: str, xml_path: str):
+    """Point each (empty) address block of a top-level component to its shard.
+
+    Every address block gets a vendor extension
+    `<irgen:shard vendor=".." library=".." name=".." version=".." href=".."/>`
+    holding the VLNV of the shard component and its file, relative to `xml_path`.
+    """
+    DocumentBuilderFactory = jpype.JClass("javax.xml.parsers.DocumentBuilderFactory")
+    factory = DocumentBuilderFactory.newInstance()
+    factory.setNamespaceAware(True)
+    document = factory.newDocumentBuilder().newDocument()
+    object_factory = get_object_factory(ipxact_version)
+
+    memory_map = component.getMemoryMaps().getMemoryMap().get(0)
+    for block in memory_map.getMemoryMap():
+        block_name = str(block.getName())
+        reference = document.createElementNS(SHARD_NAMESPACE, "irgen:shard")
+        reference.setAttribute("vendor", component.getVendor())
+        reference.setAttribute("library", component.getLibrary())
+        reference.setAttribute("name", f"{component.getName()}_{block_name}")
+        reference.setAttribute("version", component.getVersion())
+        reference.setAttribute("href", Path(get_shard_path(xml_path, block_name)).name)
+        vendor_extensions = object_factory.createVendorExtensions()
+        vendor_extensions.getAny().add(reference)
+        block.setVendorExtensions(vendor_extensions)
+
+
+def generate_sharded_xml(
+    parsed: ParsedSheets,
+    ipxact_version: str,
+    xml_path: str,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Write one XML file per address block, plus a top-level component.
+
+    The top-level component at `xml_path` holds the memory map with empty address
+    blocks, each referring to its shard (see `add_shard_references`); the
+    registers of each block are in a component of its own at
+    `get_shard_path(xml_path, block)`. Blocks are built one at a time and
+    marshalled on parallel threads. At most `max_workers` built components are
+    held at once, counting the one being built, so the JVM heap is bounded by
+    about `max_workers` times the largest block. `max_workers` defaults to the
+    number of CPUs. Returns the written paths.
+    """
+    XmlGenerator = jpype.JClass("org.example.XmlGenerator")
+    version = jpype.JClass("org.example.IpXactVersion").fromValue(ipxact_version)
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    paths = [xml_path]
+    # One component is held by the main thread while it is built
+    with ThreadPoolExecutor(max_workers=max(1, max_workers - 1)) as executor:
+        logging.info(f"Top-level XML file will be generated at: {xml_path}")
+        top = build_component(parsed, ipxact_version, with_registers=False)
+        add_shard_references(top, ipxact_version, xml_path)
+        pending: set[Future] = {
+            executor.submit(XmlGenerator.generateXml, top, version, xml_path)
+        }
+        del top
+
+        for block_name, block in split_blocks(parsed):
+            while len(pending) >= max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+
+            shard_path = get_shard_path(xml_path, block_name)
+            logging.info(f"Block '{block_name}' will be generated at: {shard_path}")
+            component = build_block_component(block, ipxact_version, block_name)
+            pending.add(
+                executor.submit(
+                    XmlGenerator.generateXml, component, version, shard_path
+                )
+            )
+            del component
+            paths.append(shard_path)
+
+        for future in pending:
+            future.result()
+    return paths
@@ -0,0 +1,71 @@
+import sys
+import logging
+from pathlib import Path
+
+import polars as pl
+import jpype
+
+from irgen.api import generate_xml
+from irgen.builder import SUPPORTED_IPXACT_VERSIONS
+from irgen.jpath import get_cds_archive_path, is_bundled, start_jvm
+from irgen.config import *
+
+
+def warmup_sheets() -> dict[str, pl.DataFrame]:
+    """A small register map that exercises every IP-XACT version's code paths."""
+    return {
+        DEFAULT_VENDOR_SHEET: pl.DataFrame(
+            {
+                "TAG": ["VENDOR", "LIBRARY", "NAME", "VERSION"],
+                "VALUE": ["example.com", "IP", "warmup", "1.0"],
+            }
+        ),
+        DEFAULT_ADDRESS_SHEET: pl.DataFrame(
+            {"BLOCK": ["block0"], "OFFSET": ["0x0"], "RANGE": ["0x1000"]}
+        ),
+        "block0": pl.DataFrame(
+            {
+                "ADDR": ["0x0", None, None, "0x4"],
+                "REG": ["reg0", None, None, "rega{n}, n=0~1"],
+                "FIELD": ["field2", "field1", "field0", "field0"],
+                "BIT": ["[31:16]", "[15:8]", "[7:0]", "[31:0]"],
+                "WIDTH": [16, 8, 8, 32],
+                "ATTRIBUTE": ["RW", "W1C", "RC", "RO"],
+                "DEFAULT": ["0x0", "0x1", "0x0", "0x0"],
+                "DESCRIPTION": [None, None, None, None],
+            }
+        ),
+    }
+
+
+def create_cds_archive(archive_path: str | None = None) -> Path:
+    """Create a Class Data Sharing archive of the classes used by a conversion.
+
+    The JVM is started with `-XX:ArchiveClassesAtExit`, converts a small register
+    map to every IP-XACT version, and writes the archive when it shuts down. As
+    the JVM can only be started once per process, this must run in a process of
+    its own.
+    """
+    path = Path(archive_path) if archive_path else get_cds_archive_path()
+    if path is None:
+        raise RuntimeError(
+            "One-file bundles cannot use an application CDS archive; "
+            "they only use the CDS archive of the bundled JRE."
+        )
+    if is_bundled() and path.resolve().is_relative_to(Path(sys._MEIPASS).resolve()):
+        raise RuntimeError(
+            f"{path} is in the bundle's temporary directory, which is deleted at exit."
+        )
+    if jpype.isJVMStarted():
+        raise RuntimeError("The JVM is already running.")
+    logging.info(f"Creating CDS archive at: {path}")
+    path.unlink(missing_ok=True)
+    start_jvm(f"-XX:ArchiveClassesAtExit={path}", use_cds_archive=False)
+    sheets = warmup_sheets()
+    for ipxact_version in SUPPORTED_IPXACT_VERSIONS:
+        generate_xml(sheets, version=ipxact_version)
+    jpype.shutdownJVM()
+
+    if not path.exists():
+        raise RuntimeError(f"The JVM did not write {path}")
+    return path
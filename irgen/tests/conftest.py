@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from irgen.reader import read_sheets
+
+EXAMPLE_XLSX = Path(__file__).parents[2] / "example.xlsx"
+
+
+@pytest.fixture(scope="session")
+def example_xlsx() -> str:
+    return str(EXAMPLE_XLSX)
+
+
+@pytest.fixture(scope="session")
+def example_sheets(example_xlsx) -> dict[str, pl.DataFrame]:
+    return read_sheets(example_xlsx, strict=True)
+
+
+def write_tables(
+    directory: Path, sheets: dict[str, pl.DataFrame], suffix: str = ".parquet"
+) -> str:
+    """Write each sheet as a table named after it, and return the directory."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for sheet_name, df in sheets.items():
+        path = directory / f"{sheet_name}{suffix}"
+        match suffix:
+            case ".parquet":
+                df.write_parquet(path)
+            case ".csv":
+                df.write_csv(path)
+            case _:
+                df.write_ipc(path, compression="uncompressed")
+    return str(directory)
+
+
+@pytest.fixture
+def make_table_dir(tmp_path):
+    """Write sheets to a new table directory under `tmp_path`."""
+
+    def make(sheets: dict[str, pl.DataFrame], name: str = "tables", suffix=".parquet"):
+        return write_tables(tmp_path / name, sheets, suffix)
+
+    return make
+
+
+@pytest.fixture
+def table_dir(make_table_dir, example_sheets) -> str:
+    return make_table_dir(example_sheets)
@@ -0,0 +1,111 @@
+import json
+
+import polars as pl
+import pytest
+
+from irgen.diff import diff_register_maps, has_differences, load_register_map
+from irgen.main import run_diff, setup_arg_parser
+
+
+@pytest.fixture
+def changed_dir(make_table_dir, example_sheets) -> str:
+    """The example with a moved block, an added, a removed and a changed register."""
+    sheets = dict(example_sheets)
+    sheets["address_map"] = sheets["address_map"].with_columns(
+        OFFSET=pl.when(pl.col("BLOCK") == "block1")
+        .then(pl.lit("0x2000"))
+        .otherwise(pl.col("OFFSET"))
+    )
+    sheets["block0"] = sheets["block0"].filter(pl.col("REG").ne_missing("reg3"))
+    block1 = sheets["block1"].with_columns(
+        ATTRIBUTE=pl.when(pl.col("REG") == "reg2")
+        .then(pl.lit("RO"))
+        .otherwise(pl.col("ATTRIBUTE"))
+    )
+    sheets["block1"] = pl.concat(
+        [
+            block1,
+            pl.DataFrame(
+                {
+                    "ADDR": ["0x30"],
+                    "REG": ["reg4"],
+                    "FIELD": ["field0"],
+                    "BIT": ["[31:0]"],
+                    "WIDTH": [32],
+                    "ATTRIBUTE": ["RW"],
+                    "DEFAULT": ["0x0"],
+                    "DESCRIPTION": [None],
+                },
+                schema=block1.schema,
+            ),
+        ]
+    )
+    return make_table_dir(sheets, "changed")
+
+
+def keys(entries: list[dict]) -> list[str]:
+    return [".".join(entry["key"]) for entry in entries]
+
+
+def test_identical_inputs_have_no_differences(example_xlsx, table_dir):
+    result = diff_register_maps(
+        load_register_map(example_xlsx), load_register_map(table_dir)
+    )
+    assert not has_differences(result)
+
+
+def test_added_removed_and_changed(example_xlsx, changed_dir):
+    result = diff_register_maps(
+        load_register_map(example_xlsx), load_register_map(changed_dir)
+    )
+
+    assert result["blocks"]["changed"] == [
+        {"key": ["block1"], "changes": {"base_address": {"old": 4096, "new": 8192}}}
+    ]
+    assert keys(result["registers"]["added"]) == ["block1.reg4"]
+    assert keys(result["registers"]["removed"]) == ["block0.reg3"]
+    assert result["registers"]["changed"] == []
+    assert keys(result["fields"]["added"]) == ["block1.reg4.field0"]
+    assert keys(result["fields"]["removed"]) == ["block0.reg3.field0"]
+    [changed] = result["fields"]["changed"]
+    assert changed["key"] == ["block1", "reg2", "field0"]
+    assert changed["changes"]["access"] == {"old": "read-write", "new": "read-only"}
+
+
+def test_sheets_outside_the_address_map_are_ignored(
+    make_table_dir, example_sheets, table_dir
+):
+    sheets = dict(example_sheets)
+    sheets["readme"] = pl.DataFrame({"NOTE": ["not a register sheet"]})
+    sheets["block9"] = sheets["block0"]
+    result = diff_register_maps(
+        load_register_map(table_dir),
+        load_register_map(make_table_dir(sheets, "extra")),
+    )
+    assert not has_differences(result)
+
+
+def test_unparsable_register_sheets_are_skipped(make_table_dir, example_sheets):
+    sheets = dict(example_sheets)
+    sheets["block1"] = pl.DataFrame({"NOTE": ["not a register sheet"]})
+    register_map = load_register_map(make_table_dir(sheets, "broken"))
+    assert register_map.fields["block"].unique().to_list() == ["block0"]
+
+
+@pytest.mark.parametrize("fmt", ["text", "json"])
+def test_exit_codes(example_xlsx, table_dir, changed_dir, tmp_path, capsys, fmt):
+    def run(old: str, new: str) -> int:
+        return run_diff(
+            setup_arg_parser().parse_args(["diff", old, new, "--format", fmt])
+        )
+
+    assert run(example_xlsx, table_dir) == 0
+    capsys.readouterr()
+    assert run(example_xlsx, changed_dir) == 1
+    output = capsys.readouterr().out
+    if fmt == "json":
+        assert keys(json.loads(output)["registers"]["added"]) == ["block1.reg4"]
+    else:
+        assert "+ register block1.reg4" in output.splitlines()
+        assert "- field block0.reg3.field0" in output.splitlines()
+    assert run(example_xlsx, str(tmp_path / "missing.xlsx")) == 2
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from irgen import index
+from irgen.builder import parse_sheets
+from irgen.main import run_lookup, setup_arg_parser
+
+
+@pytest.fixture(scope="module")
+def lookup_index(tmp_path_factory, example_sheets):
+    path = str(tmp_path_factory.mktemp("index") / f"example{index.INDEX_SUFFIX}")
+    index.write_index(index.build_index(parse_sheets(example_sheets)), path)
+    return index.load_index(path)
+
+
+def names(rows) -> list[str]:
+    return [f"{row['BLOCK']}.{row['REG']}.{row['FIELD']}" for row in rows.to_dicts()]
+
+
+@pytest.mark.parametrize("address", [0x1004, 0x1006, 0x1007])
+def test_lookup_address_within_a_register(lookup_index, address):
+    rows = index.lookup_address(lookup_index, address)
+    assert names(rows) == ["block1.reg1.field1", "block1.reg1.field0"]
+    assert rows["ADDRESS"].to_list() == [0x1004, 0x1004]
+
+
+def test_lookup_address_at_the_next_register(lookup_index):
+    rows = index.lookup_address(lookup_index, 0x1008)
+    assert names(rows) == ["block1.reg2.field0"]
+
+
+@pytest.mark.parametrize("address", [0x40, 0x0FFF, 0x2000, 0x100000])
+def test_lookup_address_outside_registers(lookup_index, address):
+    assert index.lookup_address(lookup_index, address).is_empty()
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("block0.reg0.field0", ["block0.reg0.field0"]),
+        (
+            "block0.rega_*",
+            [f"block0.rega_{n}.field0" for n in range(4)],
+        ),
+        (
+            "*.reg1.field?",
+            [
+                "block0.reg1.field1",
+                "block0.reg1.field0",
+                "block1.reg1.field1",
+                "block1.reg1.field0",
+            ],
+        ),
+        ("block1.regb_3.*", ["block1.regb_3.field1", "block1.regb_3.field0"]),
+        ("block0.reg0", []),
+        ("nothing*", []),
+    ],
+)
+def test_lookup_name(lookup_index, pattern, expected):
+    assert names(index.lookup_name(lookup_index, pattern)) == expected
+
+
+def test_formats_rebuild_the_field_name(lookup_index):
+    rows = index.lookup_address(lookup_index, 0x0)
+    assert index.format_text(rows) == (
+        "0x00000000 block0.reg0.field0 [31:0] RW reset=0x1234"
+    )
+    [row] = json.loads(index.format_json(rows))
+    assert row["NAME"] == "block0.reg0.field0"
+    assert "SORTED_NAME" not in row and "SORTED_ROW" not in row
+
+
+def test_lookup_exit_codes(tmp_path, example_sheets, capsys):
+    path = str(tmp_path / f"example{index.INDEX_SUFFIX}")
+    index.write_index(index.build_index(parse_sheets(example_sheets)), path)
+
+    def run(*args: str) -> int:
+        return run_lookup(setup_arg_parser().parse_args(["lookup", *args, "-x", path]))
+
+    assert run("0x1006") == 0
+    assert "block1.reg1.field1" in capsys.readouterr().out
+    assert run("0x40") == 1
+    assert run("--name", "block9.*") == 1
+    assert run("not-a-number") == 2
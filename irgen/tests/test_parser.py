@@ -0,0 +1,29 @@
+import polars as pl
+
+from irgen.parser import flatten_register_sheet
+
+
+def test_flatten_expands_arrays_and_drops_reserved_fields(example_sheets):
+    fields = flatten_register_sheet(example_sheets["block0"])
+
+    assert not fields["FIELD"].str.starts_with("reserved").any()
+    rega = fields.filter(pl.col("REG").str.starts_with("rega_"))
+    assert rega["REG"].to_list() == ["rega_0", "rega_1", "rega_2", "rega_3"]
+    assert rega["ADDR"].to_list() == [0x10, 0x14, 0x18, 0x1C]
+    reg1 = fields.filter(pl.col("REG") == "reg1").sort("OFFSET")
+    assert reg1.select("FIELD", "OFFSET", "WIDTH").rows() == [
+        ("field0", 0, 8),
+        ("field1", 16, 8),
+    ]
+    assert fields.filter(pl.col("REG") == "reg0")["DEFAULT"].to_list() == [0x1234]
+
+
+def test_flatten_drops_fields_with_unparsable_bits(example_sheets):
+    sheet = example_sheets["block0"].with_columns(
+        BIT=pl.when(pl.col("REG") == "reg2")
+        .then(pl.lit("31:0"))
+        .otherwise(pl.col("BIT"))
+    )
+    fields = flatten_register_sheet(sheet)
+    assert "reg2" not in fields["REG"].to_list()
+    assert fields["OFFSET"].null_count() == 0
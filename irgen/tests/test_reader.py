@@ -0,0 +1,57 @@
+import sys
+
+import polars as pl
+import pytest
+
+from irgen.reader import get_sheet_names, read_sheet, read_sheets
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow", ".ipc", ".feather", ".csv"])
+def test_tables_read_like_the_workbook(make_table_dir, example_sheets, suffix):
+    source = make_table_dir(example_sheets, suffix=suffix)
+
+    assert sorted(get_sheet_names(source)) == sorted(example_sheets)
+    sheets = read_sheets(source, strict=True)
+    for sheet_name, df in example_sheets.items():
+        assert sheets[sheet_name].equals(df), sheet_name
+
+
+def test_csv_tables_are_read_as_strings(make_table_dir, example_sheets):
+    source = make_table_dir(example_sheets, suffix=".csv")
+    block = read_sheet(source, "block0")
+    assert block.schema["WIDTH"] == pl.Int64
+    # Read as text, so "0x0" is not turned into a number
+    assert block.schema["DEFAULT"] == pl.String
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="reads /proc/self/maps")
+def test_ipc_tables_are_memory_mapped(make_table_dir, example_sheets):
+    source = make_table_dir(example_sheets, suffix=".arrow")
+    block = read_sheet(source, "block0")
+    with open("/proc/self/maps") as maps:
+        mapped = maps.read()
+    assert f"{source}/block0.arrow" in mapped
+    assert block.equals(example_sheets["block0"])
+
+
+def test_ambiguous_table_names_are_rejected(table_dir, example_sheets):
+    example_sheets["block0"].write_csv(f"{table_dir}/block0.csv")
+    with pytest.raises(ValueError, match="block0"):
+        get_sheet_names(table_dir)
+    with pytest.raises(ValueError, match="block0"):
+        read_sheets(table_dir)
+
+
+def test_directory_without_tables(tmp_path):
+    (tmp_path / "notes.txt").write_text("no tables here")
+    with pytest.raises(FileNotFoundError):
+        get_sheet_names(str(tmp_path))
+
+
+def test_unreadable_tables_are_skipped_unless_strict(table_dir):
+    with open(f"{table_dir}/block9.parquet", "w") as f:
+        f.write("not a parquet file")
+
+    assert "block9" not in read_sheets(table_dir)
+    with pytest.raises(pl.exceptions.PolarsError):
+        read_sheets(table_dir, strict=True)
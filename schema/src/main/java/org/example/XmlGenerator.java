@@ -1,21 +1,49 @@
 package org.example;
 
 import javax.xml.namespace.QName;
+import java.io.ByteArrayOutputStream;
 import java.io.File;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
 
 import jakarta.xml.bind.*;
 
 public class XmlGenerator {
-    public static <T> void generateXml(T component, IpXactVersion version, String filePath) throws Exception {
-        JAXBContext context = JAXBContext.newInstance(component.getClass());
-        Marshaller marshaller = context.createMarshaller();
+    // JAXBContext creation is expensive and the context is thread-safe, so keep one per class.
+    private static final Map<Class<?>, JAXBContext> CONTEXTS = new ConcurrentHashMap<>();
+
+    private static JAXBContext getContext(Class<?> clazz) throws JAXBException {
+        JAXBContext context = CONTEXTS.get(clazz);
+        if (context == null) {
+            context = JAXBContext.newInstance(clazz);
+            CONTEXTS.putIfAbsent(clazz, context);
+        }
+        return context;
+    }
+
+    private static <T> Marshaller createMarshaller(T component, IpXactVersion version) throws JAXBException {
+        Marshaller marshaller = getContext(component.getClass()).createMarshaller();
         marshaller.setProperty(Marshaller.JAXB_SCHEMA_LOCATION, version.getSchemaLocation());
+        return marshaller;
+    }
+
+    private static <T> JAXBElement<T> createElement(T component, IpXactVersion version) {
         @SuppressWarnings("unchecked")
         JAXBElement<T> componentElement = new JAXBElement<>(
                 new QName(version.getNameSpace(), "component"),
                 (Class<T>) component.getClass(),
                 component
         );
-        marshaller.marshal(componentElement, new File(filePath));
+        return componentElement;
+    }
+
+    public static <T> void generateXml(T component, IpXactVersion version, String filePath) throws Exception {
+        createMarshaller(component, version).marshal(createElement(component, version), new File(filePath));
+    }
+
+    public static <T> byte[] generateXmlBytes(T component, IpXactVersion version) throws Exception {
+        ByteArrayOutputStream output = new ByteArrayOutputStream();
+        createMarshaller(component, version).marshal(createElement(component, version), output);
+        return output.toByteArray();
     }
-}
\ No newline at end of file
+}